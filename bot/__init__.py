@@ -1 +1,13 @@
 """Binance Futures Trading Bot package."""
+from dotenv import load_dotenv
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """Load the .env file into the environment, once per process."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    load_dotenv()
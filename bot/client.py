@@ -1,26 +1,97 @@
 """Binance Testnet client wrapper."""
+import hashlib
+import hmac
 import os
+import threading
+import time
+from functools import lru_cache
 from typing import Optional
 
+import requests
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import load_env
 from .logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+load_env()
+
+KEEPALIVE_PING_INTERVAL = 60
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 10
+KEEP_ALIVE_HEADERS = {
+    "Connection": "keep-alive",
+    "Keep-Alive": "timeout=90, max=100",
+}
+
+
+_pinger_lock = threading.Lock()
+_pinger_started = False
+
 
 class ClientError(Exception):
     """Raised when client initialization or connection fails."""
     pass
 
 
+def _orjson_response_hook(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """Make ``response.json()`` decode with orjson instead of stdlib json."""
+    content = response.content
+    response.json = lambda **_: orjson.loads(content)
+    return response
+
+
+class _PooledClient(Client):
+    """Binance client whose HTTP session keeps connections alive.
+
+    The session is configured before ``Client.__init__`` issues its initial
+    ping, so the TLS connection opened there is reused by later orders.
+    Request signing reuses an HMAC keyed once with the API secret, and
+    responses are decoded with orjson when it is installed.
+    """
+
+    _hmac_template: Optional["hmac.HMAC"] = None
+
+    def _init_session(self) -> requests.Session:
+        session = super()._init_session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        session.mount("https://", adapter)
+        session.headers.update(KEEP_ALIVE_HEADERS)
+        if orjson is not None:
+            session.hooks["response"].append(_orjson_response_hook)
+        return session
+
+    def _hmac_signature(self, query_string: str) -> str:
+        if self._hmac_template is None:
+            self._hmac_template = hmac.new(
+                self.API_SECRET.encode("utf-8"), digestmod=hashlib.sha256
+            )
+        mac = self._hmac_template.copy()
+        mac.update(query_string.encode("utf-8"))
+        return mac.hexdigest()
+
+
+@lru_cache(maxsize=1)
 def get_client() -> Client:
     """Create and return an authenticated Binance Testnet client.
 
-    Loads API credentials from environment variables and initializes
-    the client with the Testnet base URL.
+    Reads API credentials from environment variables (the .env file is
+    loaded once, when this module is imported) and initializes
+    the client with the Testnet base URL. The client is cached, so
+    repeated calls share one connection pool.
 
     Returns:
         An authenticated Binance Client instance.
@@ -28,8 +99,6 @@ def get_client() -> Client:
     Raises:
         ClientError: If credentials are missing or authentication fails.
     """
-    load_dotenv()
-
     api_key = os.getenv("BINANCE_API_KEY")
     api_secret = os.getenv("BINANCE_API_SECRET")
 
@@ -40,16 +109,45 @@ def get_client() -> Client:
         )
 
     try:
-        client = Client(
+        client = _PooledClient(
             api_key,
             api_secret,
             testnet=True
         )
         logger.info("Binance Testnet client initialized successfully.")
-        return client
     except BinanceAPIException as e:
-        logger.error(f"Failed to initialize Binance client: {e}")
+        logger.error("Failed to initialize Binance client: %s", e)
         raise ClientError(f"Authentication failed: {e.message}")
     except Exception as e:
-        logger.error(f"Unexpected error initializing client: {e}")
+        logger.error("Unexpected error initializing client: %s", e)
         raise ClientError(f"Failed to connect to Binance: {e}")
+
+    if os.getenv("BOT_KEEPALIVE_PING") == "1":
+        _start_pinger(client)
+
+    return client
+
+
+def _pinger(client: Client) -> None:
+    """Ping the API forever so the pooled connection is never idle-closed."""
+    while True:
+        time.sleep(KEEPALIVE_PING_INTERVAL)
+        try:
+            client.ping()
+        except Exception as e:
+            logger.error("Keep-alive ping failed: %s", e)
+
+
+def _start_pinger(client: Client) -> None:
+    """Start the keep-alive pinger on a daemon thread, at most once."""
+    global _pinger_started
+    with _pinger_lock:
+        if _pinger_started:
+            return
+        _pinger_started = True
+
+    thread = threading.Thread(
+        target=_pinger, args=(client,), name="binance-keepalive", daemon=True
+    )
+    thread.start()
+    logger.info("Keep-alive pinger started.")
@@ -0,0 +1,232 @@
+"""Long-running order daemon that keeps a warm Binance client.
+
+Run with ``python -m bot.daemon``. The daemon listens on a Unix domain
+socket for one JSON order per connection, places it with a client shared
+across requests, and replies with a JSON result. ``cli.py`` sends orders
+to it when ``BOT_DAEMON_SOCKET`` is set, avoiding a cold start and a new
+TLS handshake on every invocation. Unix domain sockets are required, so
+the daemon is not available on Windows.
+"""
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+from . import load_env
+from .logging_config import get_logger
+from .validators import validate_order_params, ValidationError
+
+logger = get_logger(__name__)
+
+DEFAULT_SOCKET_PATH = "trading_bot.sock"
+SOCKET_TIMEOUT = 30.0
+
+
+class DaemonError(Exception):
+    """Raised when the daemon rejects or fails to place an order."""
+    pass
+
+
+def get_socket_path() -> str:
+    """Return the daemon socket path from BOT_DAEMON_SOCKET or the default."""
+    load_env()
+    return os.getenv("BOT_DAEMON_SOCKET") or DEFAULT_SOCKET_PATH
+
+
+def submit_order(params: Dict[str, Any], socket_path: Optional[str] = None) -> Dict[str, Any]:
+    """Send an order to a running daemon and return its response.
+
+    Args:
+        params: Order parameters, as returned by validate_order_params().
+        socket_path: The daemon socket (defaults to get_socket_path()).
+
+    Returns:
+        The order response, in the same form as place_order().
+
+    Raises:
+        OSError: If the daemon cannot be reached; the order was not sent.
+        DaemonError: If the daemon reports an error for the order, or the
+            connection fails after the order was sent.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(SOCKET_TIMEOUT)
+        sock.connect(socket_path or get_socket_path())
+        # Once connected the order may already be in flight, so later
+        # failures must not look like an unreachable daemon to callers
+        # that fall back to placing the order themselves.
+        try:
+            sock.sendall(json.dumps(params).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        except OSError as e:
+            raise DaemonError(f"Lost connection to the order daemon: {e}")
+
+    if not line:
+        raise DaemonError("Daemon closed the connection without a response.")
+
+    try:
+        reply = json.loads(line)
+        if reply.get("ok"):
+            return reply["response"]
+        error = reply.get("error", "Unknown daemon error.")
+    except (ValueError, AttributeError, KeyError):
+        raise DaemonError("Invalid response from the order daemon.")
+    raise DaemonError(error)
+
+
+class _OrderHandler(socketserver.StreamRequestHandler):
+    """Handle one JSON order per connection."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # A connection closed without a request, e.g. a liveness probe.
+            return
+
+        reply = self.server.process(line)
+        try:
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+        except (BrokenPipeError, ConnectionResetError):
+            logger.error("Order client disconnected before the reply: %s", reply)
+
+
+class OrderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that places orders with a shared client."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, client: Any) -> None:
+        # Deferred so that cli.py can import submit_order without loading
+        # python-binance.
+        from .orders import place_order, OrderError
+
+        self.client = client
+        self._place_order = place_order
+        self._order_error = OrderError
+        super().__init__(socket_path, _OrderHandler)
+        os.chmod(socket_path, 0o600)
+
+    def process(self, line: bytes) -> Dict[str, Any]:
+        """Validate and place one order, returning a JSON-able reply."""
+        try:
+            request = json.loads(line)
+            params = validate_order_params(
+                symbol=request.get("symbol"),
+                side=request.get("side"),
+                order_type=request.get("order_type"),
+                quantity=request.get("quantity"),
+                price=request.get("price"),
+            )
+        except (ValueError, AttributeError, TypeError):
+            return {"ok": False, "error": "Malformed order request."}
+        except ValidationError as e:
+            return {"ok": False, "error": str(e)}
+
+        try:
+            response = self._place_order(
+                client=self.client,
+                symbol=params["symbol"],
+                side=params["side"],
+                order_type=params["order_type"],
+                quantity=params["quantity"],
+                price=params["price"],
+            )
+        except self._order_error as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            logger.error("Daemon failed to place order: %s", e)
+            return {"ok": False, "error": f"Unexpected error: {e}"}
+
+        return {"ok": True, "response": response}
+
+
+def _claim_socket_path(socket_path: str) -> None:
+    """Remove a stale socket at socket_path so the daemon can bind to it.
+
+    Raises:
+        DaemonError: If the path is not a socket, or a daemon is already
+            listening on it.
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise DaemonError(f"Refusing to replace '{socket_path}': it is not a socket.")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+
+    raise DaemonError(f"An order daemon is already listening on '{socket_path}'.")
+
+
+def serve(socket_path: Optional[str] = None) -> None:
+    """Create the client and serve orders until interrupted or terminated.
+
+    The keep-alive pinger is always started, so the connection stays warm
+    while the daemon is idle. SIGTERM stops the server cleanly.
+
+    Args:
+        socket_path: The socket to listen on (defaults to get_socket_path()).
+
+    Raises:
+        ClientError: If the Binance client cannot be initialized.
+        DaemonError: If the socket path is taken.
+    """
+    from .client import get_client, _start_pinger
+
+    socket_path = socket_path or get_socket_path()
+    _claim_socket_path(socket_path)
+
+    client = get_client()
+    _start_pinger(client)
+    server = OrderServer(socket_path, client)
+
+    # shutdown() waits for serve_forever() to return, so it must not run
+    # on the thread that is serving.
+    def _on_sigterm(signum, frame) -> None:
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    previous_handler = None
+    if threading.current_thread() is threading.main_thread():
+        previous_handler = signal.signal(signal.SIGTERM, _on_sigterm)
+
+    logger.info("Order daemon listening on %s", socket_path)
+    try:
+        server.serve_forever()
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGTERM, previous_handler)
+        server.server_close()
+        os.unlink(socket_path)
+        logger.info("Order daemon stopped.")
+
+
+def main() -> int:
+    """Entry point for ``python -m bot.daemon``."""
+    from .client import ClientError
+
+    socket_path = get_socket_path()
+    print(f"Starting order daemon on {socket_path} (Ctrl+C to stop)")
+    try:
+        serve(socket_path)
+    except (ClientError, DaemonError) as e:
+        print(f"Error: {e}")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
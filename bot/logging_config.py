@@ -1,19 +1,85 @@
 """Logging configuration for the trading bot."""
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 LOG_FILE = "trading.log"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_LEVEL = logging.INFO
+LOG_BUFFER_CAPACITY = 64
+
+_configured = False
+
+
+class _BatchFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to the caller.
+
+    Records are only appended to the stream's buffer, so a whole batch
+    reaches the file with a single flush().
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers once per batch of records.
+
+    A batch ends when the queue is drained or LOG_BUFFER_CAPACITY records
+    have been handled, so idle periods never leave records unwritten.
+    """
+
+    def __init__(self, log_queue, *handlers) -> None:
+        super().__init__(log_queue, *handlers)
+        self._pending = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        self._pending += 1
+        if self._pending >= LOG_BUFFER_CAPACITY or self.queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        self._pending = 0
+        for handler in self.handlers:
+            handler.flush()
+
+    def stop(self) -> None:
+        super().stop()
+        self.flush()
 
 
 def setup_logging() -> None:
-    """Configure the root logger for file output."""
-    logging.basicConfig(
-        filename=LOG_FILE,
-        level=LOG_LEVEL,
-        format=LOG_FORMAT,
-    )
+    """Configure the root logger to write to LOG_FILE from a background thread.
+
+    Does nothing if the root logger already has handlers, or if called again.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    file_handler = _BatchFileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    listener = _BatchingQueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(QueueHandler(log_queue))
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -1,21 +1,52 @@
 """Order placement logic for Binance Testnet."""
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceOrderException
-from binance.enums import SIDE_BUY, SIDE_SELL, ORDER_TYPE_MARKET, ORDER_TYPE_LIMIT, TIME_IN_FORCE_GTC
+from binance.enums import ORDER_TYPE_MARKET, ORDER_TYPE_LIMIT, TIME_IN_FORCE_GTC
 import requests
 
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+MAX_BATCH_WORKERS = 10
+
 
 class OrderError(Exception):
     """Raised when order placement fails."""
     pass
 
 
+def _market_params(symbol: str, side: str, quantity: float, price: Optional[float]) -> Dict[str, Any]:
+    """Build request parameters for a MARKET order."""
+    return {
+        "symbol": symbol,
+        "side": side,
+        "type": ORDER_TYPE_MARKET,
+        "quantity": quantity,
+    }
+
+
+def _limit_params(symbol: str, side: str, quantity: float, price: Optional[float]) -> Dict[str, Any]:
+    """Build request parameters for a GTC LIMIT order."""
+    return {
+        "symbol": symbol,
+        "side": side,
+        "type": ORDER_TYPE_LIMIT,
+        "quantity": quantity,
+        "price": price,
+        "timeInForce": TIME_IN_FORCE_GTC,
+    }
+
+
+_ORDER_BUILDERS = {
+    ORDER_TYPE_MARKET: _market_params,
+    ORDER_TYPE_LIMIT: _limit_params,
+}
+
+
 def place_order(
     client: Client,
     symbol: str,
@@ -44,28 +75,29 @@ def place_order(
     Raises:
         OrderError: If the order placement fails.
     """
-    params = {
-        "symbol": symbol,
-        "side": side,
-        "type": order_type,
-        "quantity": quantity,
-    }
+    builder = _ORDER_BUILDERS.get(order_type)
+    if builder is None:
+        raise OrderError(f"Unsupported order type '{order_type}'.")
 
-    if order_type == "LIMIT":
-        params["price"] = price
-        params["timeInForce"] = TIME_IN_FORCE_GTC
+    params = builder(symbol, side, quantity, price)
 
-    logger.info(f"Placing order: {params}")
+    logger.info("Placing order: %s", params)
 
     try:
         response = client.create_order(**params)
-        logger.info(f"Order response: {response}")
+        logger.info("Order response: %s", response)
 
         # Calculate average price from fills if available
         avg_price = "N/A"
-        if response.get("fills"):
-            total_qty = sum(float(f["qty"]) for f in response["fills"])
-            total_value = sum(float(f["qty"]) * float(f["price"]) for f in response["fills"])
+        fills = response.get("fills")
+        if fills:
+            to_float = float
+            total_qty = 0.0
+            total_value = 0.0
+            for f in fills:
+                qty = to_float(f["qty"])
+                total_qty += qty
+                total_value += qty * to_float(f["price"])
             if total_qty > 0:
                 avg_price = str(round(total_value / total_qty, 2))
         elif response.get("price"):
@@ -81,17 +113,62 @@ def place_order(
         return result
 
     except BinanceOrderException as e:
-        logger.error(f"Order error: {e.message}")
+        logger.error("Order error: %s", e.message)
         raise OrderError(f"Order rejected: {e.message}")
 
     except BinanceAPIException as e:
-        logger.error(f"API error: {e.message}")
+        logger.error("API error: %s", e.message)
         raise OrderError(f"API error: {e.message}")
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Network error: {e}")
+        logger.error("Network error: %s", e)
         raise OrderError(f"Network error: Unable to connect to Binance. Please check your internet connection.")
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         raise OrderError(f"Unexpected error: {e}")
+
+
+def _place_one(client: Client, order: Dict[str, Any]) -> Tuple[bool, Union[Dict[str, Any], OrderError]]:
+    """Place a single order from a batch, returning a tagged result."""
+    try:
+        return True, place_order(
+            client=client,
+            symbol=order["symbol"],
+            side=order["side"],
+            order_type=order["order_type"],
+            quantity=order["quantity"],
+            price=order.get("price"),
+        )
+    except OrderError as e:
+        return False, e
+    except KeyError as e:
+        logger.error("Batch order missing field: %s", e)
+        return False, OrderError(f"Invalid order: missing field {e}.")
+
+
+def place_orders(
+    client: Client,
+    orders: List[Dict[str, Any]],
+) -> List[Tuple[bool, Union[Dict[str, Any], OrderError]]]:
+    """Place several orders concurrently on Binance Testnet.
+
+    Orders are submitted in parallel over the client's connection pool, so
+    the total latency is close to that of the slowest order. A failing
+    order does not cancel the others.
+
+    Args:
+        client: An authenticated Binance Client instance.
+        orders: Validated order parameters, as returned by
+            validate_order_params().
+
+    Returns:
+        One (success, result) tuple per order, in input order. result is
+        the place_order() response on success, or an OrderError otherwise.
+    """
+    if not orders:
+        return []
+
+    workers = min(len(orders), MAX_BATCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda order: _place_one(client, order), orders))
@@ -1,5 +1,15 @@
 """Input validation for trading bot parameters."""
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+_SYMBOL_RE = re.compile(r"[A-Z0-9]+USDT")
+
+SIDES = ("BUY", "SELL")
+ORDER_TYPES = ("MARKET", "LIMIT")
+
+_SIDES = frozenset(SIDES)
+_ORDER_TYPES = frozenset(ORDER_TYPES)
 
 
 class ValidationError(Exception):
@@ -24,7 +34,7 @@ def validate_symbol(symbol: str) -> str:
 
     symbol = symbol.upper()
 
-    if not symbol.endswith("USDT"):
+    if not _SYMBOL_RE.fullmatch(symbol):
         raise ValidationError(
             f"Invalid symbol '{symbol}'. Only USDT-M pairs are supported (e.g., BTCUSDT)."
         )
@@ -48,11 +58,10 @@ def validate_side(side: str) -> str:
         raise ValidationError("Side is required.")
 
     side = side.upper()
-    valid_sides = ("BUY", "SELL")
 
-    if side not in valid_sides:
+    if side not in _SIDES:
         raise ValidationError(
-            f"Invalid side '{side}'. Must be one of: {', '.join(valid_sides)}."
+            f"Invalid side '{side}'. Must be one of: {', '.join(SIDES)}."
         )
 
     return side
@@ -74,11 +83,10 @@ def validate_order_type(order_type: str) -> str:
         raise ValidationError("Order type is required.")
 
     order_type = order_type.upper()
-    valid_types = ("MARKET", "LIMIT")
 
-    if order_type not in valid_types:
+    if order_type not in _ORDER_TYPES:
         raise ValidationError(
-            f"Invalid order type '{order_type}'. Must be one of: {', '.join(valid_types)}."
+            f"Invalid order type '{order_type}'. Must be one of: {', '.join(ORDER_TYPES)}."
         )
 
     return order_type
@@ -144,6 +152,18 @@ def validate_price(price: Optional[str], order_type: str) -> Optional[float]:
     return None
 
 
+@lru_cache(maxsize=256)
+def _validate_symbol_side_type(symbol: str, side: str, order_type: str) -> Tuple[str, str, str]:
+    """Validate the symbol, side and order type together.
+
+    These come from a small set of values, so results are cached and a
+    strategy resubmitting the same combination skips re-validation.
+    Invalid input raises and is never cached.
+    """
+    validated_type = validate_order_type(order_type)
+    return validate_symbol(symbol), validate_side(side), validated_type
+
+
 def validate_order_params(
     symbol: str,
     side: str,
@@ -166,11 +186,13 @@ def validate_order_params(
     Raises:
         ValidationError: If any parameter is invalid.
     """
-    validated_type = validate_order_type(order_type)
+    validated_symbol, validated_side, validated_type = _validate_symbol_side_type(
+        symbol, side, order_type
+    )
 
     return {
-        "symbol": validate_symbol(symbol),
-        "side": validate_side(side),
+        "symbol": validated_symbol,
+        "side": validated_side,
         "order_type": validated_type,
         "quantity": validate_quantity(quantity),
         "price": validate_price(price, validated_type),
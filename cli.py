@@ -1,19 +1,67 @@
 #!/usr/bin/env python3
 """CLI entry point for the Binance Futures Trading Bot."""
-import argparse
+import importlib
+import os
 import sys
+import threading
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List, Optional
 
-from bot.client import get_client, ClientError
-from bot.orders import place_order, OrderError
+from bot import load_env
 from bot.validators import validate_order_params, ValidationError
 
+if TYPE_CHECKING:
+    import argparse
+
+# Imported in the background by main(); they pull in python-binance and
+# requests, which dominate start-up time.
+_API_MODULES = ("bot.client", "bot.orders")
+
+
+_FLAGS = {
+    "--symbol": "symbol",
+    "--side": "side",
+    "--type": "order_type",
+    "--quantity": "quantity",
+    "--price": "price",
+}
+_REQUIRED = ("symbol", "side", "order_type", "quantity")
+_CHOICES = {
+    "side": ("BUY", "SELL", "buy", "sell"),
+    "order_type": ("MARKET", "LIMIT", "market", "limit"),
+}
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments.
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common ``--flag value`` form without building a parser.
 
     Returns:
-        Parsed arguments namespace.
+        Parsed arguments, or None if argv needs the full argparse parser
+        (help, unknown or repeated flags, missing or invalid values).
     """
+    if len(argv) % 2:
+        return None
+
+    values = dict.fromkeys(_FLAGS.values())
+    for flag, value in zip(argv[::2], argv[1::2]):
+        dest = _FLAGS.get(flag)
+        if dest is None or values[dest] is not None or value.startswith("-"):
+            return None
+        values[dest] = value
+
+    if any(values[dest] is None for dest in _REQUIRED):
+        return None
+    for dest, choices in _CHOICES.items():
+        if values[dest] not in choices:
+            return None
+
+    return SimpleNamespace(**values)
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the full argparse parser, used for help and error reporting."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Binance Futures Testnet Trading Bot",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -32,14 +80,14 @@ Examples:
     parser.add_argument(
         "--side",
         required=True,
-        choices=["BUY", "SELL", "buy", "sell"],
+        choices=_CHOICES["side"],
         help="Order side: BUY or SELL",
     )
     parser.add_argument(
         "--type",
         required=True,
         dest="order_type",
-        choices=["MARKET", "LIMIT", "market", "limit"],
+        choices=_CHOICES["order_type"],
         help="Order type: MARKET or LIMIT",
     )
     parser.add_argument(
@@ -53,7 +101,28 @@ Examples:
         help="Order price (required for LIMIT orders)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """Parse command-line arguments.
+
+    Well-formed invocations are parsed directly; anything else (including
+    --help) goes through argparse for its usual help and error output.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:]).
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = _fast_parse(argv)
+    if args is None:
+        args = SimpleNamespace(**vars(_build_parser().parse_args(argv)))
+    return args
 
 
 def print_request_summary(params: dict) -> None:
@@ -97,12 +166,29 @@ def print_error(message: str) -> None:
     print()
 
 
+def _preload_api_modules() -> None:
+    """Import the API modules, leaving any import error to the caller."""
+    try:
+        for name in _API_MODULES:
+            importlib.import_module(name)
+    except Exception:
+        pass
+
+
 def main() -> int:
     """Main entry point for the trading bot CLI.
 
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    load_env()
+    daemon_socket = os.getenv("BOT_DAEMON_SOCKET")
+
+    preload = None
+    if not daemon_socket:
+        preload = threading.Thread(target=_preload_api_modules, daemon=True)
+        preload.start()
+
     args = parse_args()
 
     # Step 1: Validate inputs
@@ -121,14 +207,36 @@ def main() -> int:
     # Step 2: Print request summary
     print_request_summary(params)
 
-    # Step 3: Initialize client
+    # Step 3: Hand the order to a running daemon, if one is configured
+    if daemon_socket:
+        from bot.daemon import submit_order, DaemonError
+
+        try:
+            response = submit_order(params, daemon_socket)
+        except DaemonError as e:
+            print_error(str(e))
+            return 1
+        except OSError:
+            # No daemon listening; place the order in-process instead.
+            response = None
+
+        if response is not None:
+            print_response(response)
+            return 0
+
+    # Step 4: Initialize client
+    if preload is not None:
+        preload.join()
+    from bot.client import get_client, ClientError
+    from bot.orders import place_order, OrderError
+
     try:
         client = get_client()
     except ClientError as e:
         print_error(str(e))
         return 1
 
-    # Step 4: Place order
+    # Step 5: Place order
     try:
         response = place_order(
             client=client,
@@ -142,7 +250,7 @@ def main() -> int:
         print_error(str(e))
         return 1
 
-    # Step 5: Print response
+    # Step 6: Print response
     print_response(response)
 
     return 0